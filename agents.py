@@ -1,13 +1,13 @@
 ## Importing libraries and files
 from conf import settings
 
-from crewai import Agent,LLM
+from crewai import Agent
+from providers import build_llm, agent_max_rpm
 
 from tools import search_tool, financial_document_tool, investment_tool, risk_tool
 
 ### Loading LLM
-llm = LLM(model = settings.GEMINI_MODEL,
-api_key=settings.GEMINI_API_KEY)
+llm = build_llm()
 
 # Creating an Experienced Financial Analyst agent
 financial_analyst=Agent(
@@ -25,7 +25,7 @@ financial_analyst=Agent(
     tools=[financial_document_tool],
     llm=llm,
     max_iter=1,
-    max_rpm=1,
+    max_rpm=agent_max_rpm(1),
     allow_delegation=True  # Allow delegation to other specialists
 )
 
@@ -46,7 +46,7 @@ verifier = Agent(
     llm=llm,
     tools=[search_tool],
     max_iter=1,
-    max_rpm=1,
+    max_rpm=agent_max_rpm(1),
     allow_delegation=True
 )
 
@@ -65,7 +65,7 @@ investment_advisor = Agent(
     llm=llm,
     tools=[investment_tool],
     max_iter=1,
-    max_rpm=1,
+    max_rpm=agent_max_rpm(1),
     allow_delegation=False
 )
 
@@ -83,8 +83,8 @@ risk_assessor = Agent(
         "risk mitigation recommendations following industry best practices and regulatory standards."
     ),
     llm=llm,
-    tool=[risk_tool],
+    tools=[risk_tool],
     max_iter=1,
-    max_rpm=1,
+    max_rpm=agent_max_rpm(1),
     allow_delegation=False
 )
@@ -0,0 +1,110 @@
+"""Search index benchmark: /search query latency at tens of thousands of documents.
+
+Builds a throwaway index of synthetic analyses, then times SearchIndex.search
+for multi-term queries with and without filters. Fails when the p95 latency
+exceeds the budget:
+
+    python -m benchmarks.bench_search --documents 20000 --words 1500 --budget-ms 100
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from benchmarks.common import REPO_ROOT, summarize, write_results
+
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from search_index import SearchIndex  # noqa: E402
+
+FINANCIAL_TERMS = (
+    "revenue margin liquidity leverage covenant cash flow earnings guidance volatility exposure credit "
+    "default capital reserves growth decline operating expenses dividend valuation outlook compliance "
+    "disclosure risk debt equity quarter fiscal impairment goodwill hedging derivative inventory receivables"
+).split()
+
+QUERIES = [
+    {"q": "revenue risk debt liquidity"},
+    {"q": "covenant breach"},
+    {"q": "operating margin decline guidance"},
+    {"q": "goodwill impairment"},
+    {"q": "cash flow dividend", "filename": "report_1"},
+    {"q": "credit exposure volatility", "date_from": datetime(2026, 3, 1), "date_to": datetime(2026, 6, 30)},
+    {"q": "revenue risk debt liquidity", "page": 5},
+]
+
+
+def synthetic_body(rng: random.Random, words: int, filler: List[str]) -> str:
+    # Mostly filler with a sprinkling of domain terms, so common query terms match most documents
+    return " ".join(rng.choice(FINANCIAL_TERMS) if rng.random() < 0.08 else rng.choice(filler) for _ in range(words))
+
+
+def build_index(path: str, documents: int, words: int, seed: int) -> float:
+    """Populate a fresh index and return the seconds taken."""
+    rng = random.Random(seed)
+    filler = [f"w{i}" for i in range(20000)]
+    index = SearchIndex(path)
+    start = time.perf_counter()
+    base = datetime(2026, 1, 1)
+    for i in range(documents):
+        index.add_document(
+            session_id=f"session-{i}",
+            filename=f"report_{i % 500}.pdf",
+            query="Analyze this financial document for investment insights",
+            output=synthetic_body(rng, words // 3, filler),
+            document_text=synthetic_body(rng, words - words // 3, filler),
+            created_at=base + timedelta(minutes=17 * i),
+        )
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=20000)
+    parser.add_argument("--words", type=int, default=1500, help="Indexed words per document")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per query")
+    parser.add_argument("--budget-ms", type=float, default=100.0, help="Fail if any query's p95 exceeds this")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", help="JSON results path (default: benchmarks/results/search-<timestamp>.json)")
+    args = parser.parse_args()
+
+    queries: List[Dict[str, Any]] = []
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "search.db")
+        build_s = build_index(path, args.documents, args.words, args.seed)
+        index = SearchIndex(path)
+        print(f"indexed {args.documents} documents x {args.words} words in {build_s:.1f} s "
+              f"({os.path.getsize(path) / (1024 * 1024):.0f} MB)")
+
+        for params in QUERIES:
+            hits = index.search(**params)  # warm the page cache
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                index.search(**params)
+                timings.append(time.perf_counter() - start)
+            latency = summarize(timings)
+            queries.append({"params": {k: str(v) for k, v in params.items()}, "total_hits": hits["total"], "latency_s": latency})
+            print(f"  p95 {latency['p95'] * 1000:7.1f} ms  hits {hits['total']:>6}  {params}")
+
+    worst_p95_ms = max(q["latency_s"]["p95"] for q in queries) * 1000
+    path = write_results("search", {
+        "config": {"documents": args.documents, "words": args.words, "repeat": args.repeat, "seed": args.seed},
+        "build_s": round(build_s, 2),
+        "budget_ms": args.budget_ms,
+        "worst_p95_ms": round(worst_p95_ms, 2),
+        "queries": queries,
+    }, args.output)
+    print(f"worst p95 {worst_p95_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    print(f"Results written to {path}")
+    return 1 if worst_p95_ms > args.budget_ms else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
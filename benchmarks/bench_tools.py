@@ -0,0 +1,106 @@
+"""Throughput and peak-memory benchmark for the PDF, investment and risk tools.
+
+Each scenario generates a synthetic report, then runs the tool in a fresh
+process so peak memory is attributable to that scenario alone:
+
+    python -m benchmarks.bench_tools --pages 1,10,50 --tables-per-page 0,2 --images-per-page 0,2
+"""
+
+import argparse
+import itertools
+import os
+import sys
+import tempfile
+from typing import Any, Dict, List
+
+from benchmarks.common import REPO_ROOT, measure_isolated, summarize, write_results
+from benchmarks.synthetic_pdf import generate_financial_pdf
+
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+
+from tools import FinancialDocumentTool, InvestmentTool, RiskTool  # noqa: E402
+
+
+def run_document_tool(path: str) -> int:
+    return len(FinancialDocumentTool()._run(path))
+
+
+def run_investment_tool(text: str) -> int:
+    return len(InvestmentTool()._run(text))
+
+
+def run_risk_tool(text: str) -> int:
+    return len(RiskTool()._run(text))
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(v) for v in value.split(",") if v.strip()]
+
+
+def bench_scenario(workdir: str, pages: int, tables: int, images: int, repeat: int) -> Dict[str, Any]:
+    path = os.path.join(workdir, f"report_p{pages}_t{tables}_i{images}.pdf")
+    generate_financial_pdf(path, pages=pages, tables_per_page=tables, images_per_page=images)
+    text = FinancialDocumentTool()._run(path)
+    if "[Error processing image" in text:
+        # Timings would measure the exception path, not OCR
+        detail = text[text.index("[Error processing image"):].split("\n", 1)[0]
+        raise RuntimeError(
+            f"OCR failed on {os.path.basename(path)}: {detail}. Install Tesseract "
+            "(see README) or benchmark with --images-per-page 0."
+        )
+
+    document = measure_isolated(run_document_tool, path, repeat=repeat)
+    investment = measure_isolated(run_investment_tool, text, repeat=repeat)
+    risk = measure_isolated(run_risk_tool, text, repeat=repeat)
+
+    def tool_result(outcome: Dict[str, Any], unit: str, amount: float) -> Dict[str, Any]:
+        latency = summarize(outcome["timings"])
+        return {
+            "latency_s": latency,
+            f"{unit}_per_second": round(amount / latency["median"], 2) if latency["median"] else None,
+            "peak_rss_mb": outcome["peak_rss_mb"],
+            "rss_growth_mb": outcome["rss_growth_mb"],
+            "python_heap_peak_mb": outcome["python_heap_peak_mb"],
+        }
+
+    return {
+        "pages": pages,
+        "tables_per_page": tables,
+        "images_per_page": images,
+        "file_size_mb": round(os.path.getsize(path) / (1024 * 1024), 3),
+        "extracted_chars": len(text),
+        "financial_document_tool": tool_result(document, "pages", pages),
+        "investment_tool": tool_result(investment, "chars", len(text)),
+        "risk_tool": tool_result(risk, "chars", len(text)),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=_int_list, default=[1, 10, 50], help="Comma-separated page counts")
+    parser.add_argument("--tables-per-page", type=_int_list, default=[1], help="Comma-separated table densities")
+    parser.add_argument("--images-per-page", type=_int_list, default=[0, 1], help="Comma-separated image counts")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per tool per scenario")
+    parser.add_argument("--output", help="JSON results path (default: benchmarks/results/tools-<timestamp>.json)")
+    args = parser.parse_args()
+
+    scenarios = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for pages, tables, images in itertools.product(args.pages, args.tables_per_page, args.images_per_page):
+            result = bench_scenario(workdir, pages, tables, images, args.repeat)
+            scenarios.append(result)
+            doc = result["financial_document_tool"]
+            print(
+                f"pages={pages:<4} tables/page={tables:<2} images/page={images:<2} "
+                f"extract median {doc['latency_s']['median'] * 1000:8.1f} ms  "
+                f"{doc['pages_per_second']:8.1f} pages/s  peak RSS {doc['peak_rss_mb']:7.1f} MB"
+            )
+
+    path = write_results("tools", {"repeat": args.repeat, "scenarios": scenarios}, args.output)
+    print(f"Results written to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Shared helpers for the benchmark scripts: isolated measurement and JSON results."""
+
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(REPO_ROOT, "benchmarks", "results")
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+def environment() -> Dict[str, Any]:
+    """Metadata stored with every result file so runs can be compared across commits."""
+    return {
+        "commit": git_revision(),
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Latency summary (seconds) for a list of samples."""
+    ordered = sorted(samples)
+    if not ordered:
+        return {}
+
+    def pct(p: float) -> float:
+        return ordered[min(int(round(p * (len(ordered) - 1))), len(ordered) - 1)]
+
+    return {
+        "count": len(ordered),
+        "min": round(ordered[0], 6),
+        "median": round(statistics.median(ordered), 6),
+        "p95": round(pct(0.95), 6),
+        "p99": round(pct(0.99), 6),
+        "max": round(ordered[-1], 6),
+        "mean": round(statistics.fmean(ordered), 6),
+    }
+
+
+def _max_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def _measure_child(queue, fn: Callable, args: tuple, repeat: int) -> None:
+    try:
+        if REPO_ROOT not in sys.path:
+            sys.path.insert(0, REPO_ROOT)
+        baseline_rss = _max_rss_mb()
+        timings = []
+        result = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = fn(*args)
+            timings.append(time.perf_counter() - start)
+        peak_rss = _max_rss_mb()
+
+        # tracemalloc slows allocation-heavy code several-fold, so the Python heap
+        # peak comes from one extra run after the timed (and RSS-measured) ones.
+        tracemalloc.start()
+        try:
+            fn(*args)
+            _, traced_peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        queue.put({
+            "timings": timings,
+            "result": result,
+            "peak_rss_mb": round(peak_rss, 2),
+            "rss_growth_mb": round(peak_rss - baseline_rss, 2),
+            "python_heap_peak_mb": round(traced_peak / (1024 * 1024), 2),
+        })
+    except Exception as e:
+        queue.put({"error": f"{type(e).__name__}: {e}"})
+
+
+def measure_isolated(fn: Callable, *args: Any, repeat: int = 3) -> Dict[str, Any]:
+    """
+    Run `fn(*args)` `repeat` times in a fresh spawned process so peak memory is per scenario,
+    then once more under tracemalloc for the Python heap peak (never included in the timings).
+    `fn` must be importable (module-level) and its return value picklable.
+    Note tracemalloc only sees Python allocations; MuPDF's native buffers show up in RSS.
+    """
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    proc = ctx.Process(target=_measure_child, args=(queue, fn, args, repeat))
+    proc.start()
+    outcome = queue.get()
+    proc.join()
+    if "error" in outcome:
+        raise RuntimeError(outcome["error"])
+    return outcome
+
+
+def write_results(name: str, payload: Dict[str, Any], path: Optional[str] = None) -> str:
+    """Write `payload` (plus environment metadata) as JSON and return the file path."""
+    if path is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
+        path = os.path.join(RESULTS_DIR, f"{name}-{stamp}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"benchmark": name, "environment": environment(), **payload}, f, indent=2)
+    return path
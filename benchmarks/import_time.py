@@ -0,0 +1,108 @@
+"""Import-time benchmark guarding the API's cold start.
+
+Imports a module (default: ``main``) in fresh interpreters with ``-X importtime``
+and fails when it pulls in worker-only dependencies or exceeds a time budget.
+
+    python benchmarks/import_time.py --runs 5 --budget-ms 1500
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules the HTTP layer must never import at startup; they belong to the workers.
+FORBIDDEN_MODULES = (
+    "crewai",
+    "crewai_tools",
+    "litellm",
+    "fitz",
+    "pandas",
+    "PIL",
+    "agents",
+    "task",
+    "tools",
+)
+
+
+def measure_import(module: str) -> Tuple[float, Dict[str, int]]:
+    """Import `module` in a fresh interpreter. Returns (total seconds, {module: cumulative us})."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+
+    cumulative: Dict[str, int] = {}
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        if not cumulative_us.strip().isdigit():
+            continue  # header line
+        us = int(cumulative_us)
+        cumulative[name.strip()] = us
+        if not name.startswith("  "):  # top-level import (nested ones are indented)
+            total_us += us
+    return total_us / 1e6, cumulative
+
+
+def forbidden_imports(imported: List[str]) -> List[str]:
+    return sorted(
+        name for name in imported
+        if any(name == mod or name.startswith(mod + ".") for mod in FORBIDDEN_MODULES)
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="main", help="Module to import (default: main)")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh-interpreter runs; the median is reported")
+    parser.add_argument("--budget-ms", type=float, default=1500.0, help="Fail if the median import time exceeds this")
+    parser.add_argument("--top", type=int, default=10, help="Show the N slowest modules")
+    parser.add_argument("--json", dest="json_path", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    timings = []
+    cumulative: Dict[str, int] = {}
+    for _ in range(max(args.runs, 1)):
+        seconds, cumulative = measure_import(args.module)
+        timings.append(seconds)
+
+    median_ms = statistics.median(timings) * 1000
+    offenders = forbidden_imports(list(cumulative))
+    slowest = sorted(cumulative.items(), key=lambda item: item[1], reverse=True)[:args.top]
+
+    print(f"import {args.module}: median {median_ms:.1f} ms over {len(timings)} runs (budget {args.budget_ms:.0f} ms)")
+    for name, us in slowest:
+        print(f"  {us / 1000:8.1f} ms  {name}")
+    if offenders:
+        print("Forbidden worker-only modules imported:")
+        for name in offenders:
+            print(f"  {name}")
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "benchmark": "import_time",
+                "module": args.module,
+                "runs_ms": [round(t * 1000, 2) for t in timings],
+                "median_ms": round(median_ms, 2),
+                "budget_ms": args.budget_ms,
+                "forbidden_imports": offenders,
+            }, f, indent=2)
+
+    return 1 if offenders or median_ms > args.budget_ms else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""End-to-end /analyze load test.
+
+Uploads synthetic reports to a running API with the given concurrency, polls
+``/task/{task_id}`` until each analysis finishes and records submit latency,
+end-to-end latency and throughput. Run the API normally and a worker with an
+offline provider (``PROVIDER_MODE=synthetic`` or ``replay``, see providers.py), then:
+
+    python -m benchmarks.load_test --base-url http://localhost:8000 --requests 50 --concurrency 8 --pages 10
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Tuple
+from urllib import request as urlrequest
+
+from benchmarks.common import summarize, write_results
+from benchmarks.synthetic_pdf import generate_financial_pdf
+
+
+def _post_multipart(url: str, pdf_bytes: bytes, filename: str, query: str, timeout: float) -> Dict[str, Any]:
+    boundary = uuid.uuid4().hex
+    body = b"".join([
+        f"--{boundary}\r\nContent-Disposition: form-data; name=\"query\"\r\n\r\n{query}\r\n".encode(),
+        f"--{boundary}\r\nContent-Disposition: form-data; name=\"file\"; filename=\"{filename}\"\r\n"
+        "Content-Type: application/pdf\r\n\r\n".encode(),
+        pdf_bytes,
+        f"\r\n--{boundary}--\r\n".encode(),
+    ])
+    req = urlrequest.Request(url, data=body, method="POST", headers={"Content-Type": f"multipart/form-data; boundary={boundary}"})
+    with urlrequest.urlopen(req, timeout=timeout) as resp:
+        return json.loads(resp.read())
+
+
+def _get_json(url: str, timeout: float) -> Dict[str, Any]:
+    with urlrequest.urlopen(url, timeout=timeout) as resp:
+        return json.loads(resp.read())
+
+
+def run_one(base_url: str, pdf_bytes: bytes, index: int, poll_interval: float, deadline_s: float) -> Tuple[str, float, float]:
+    """Submit one document and wait for it. Returns (final state, submit seconds, end-to-end seconds)."""
+    start = time.perf_counter()
+    submitted = _post_multipart(
+        f"{base_url}/analyze", pdf_bytes, f"load_test_{index}.pdf",
+        "Analyze this financial document for investment insights", timeout=60,
+    )
+    submit_s = time.perf_counter() - start
+
+    task_url = f"{base_url}/task/{submitted['task_id']}"
+    while time.perf_counter() - start < deadline_s:
+        status = _get_json(task_url, timeout=30)
+        if status["state"] in ("SUCCESS", "FAILURE"):
+            state = status["state"]
+            # analyze_document_task reports pipeline errors in a SUCCESS payload
+            if state == "SUCCESS" and (status.get("result") or {}).get("status") == "error":
+                state = "ERROR"
+            return state, submit_s, time.perf_counter() - start
+        time.sleep(poll_interval)
+    return "TIMEOUT", submit_s, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--requests", type=int, default=20, help="Documents to submit")
+    parser.add_argument("--concurrency", type=int, default=4, help="Parallel clients")
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--tables-per-page", type=int, default=1)
+    parser.add_argument("--images-per-page", type=int, default=0)
+    parser.add_argument("--poll-interval", type=float, default=0.25)
+    parser.add_argument("--timeout", type=float, default=600, help="Per-document deadline in seconds")
+    parser.add_argument("--output", help="JSON results path (default: benchmarks/results/load-<timestamp>.json)")
+    args = parser.parse_args()
+    base_url = args.base_url.rstrip("/")
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = generate_financial_pdf(
+            os.path.join(workdir, "load_test.pdf"),
+            pages=args.pages,
+            tables_per_page=args.tables_per_page,
+            images_per_page=args.images_per_page,
+        )
+        with open(path, "rb") as f:
+            pdf_bytes = f.read()
+
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        futures = [
+            pool.submit(run_one, base_url, pdf_bytes, i, args.poll_interval, args.timeout)
+            for i in range(args.requests)
+        ]
+        outcomes = []
+        for future in futures:
+            try:
+                outcomes.append(future.result())
+            except Exception as e:
+                outcomes.append((f"CLIENT_ERROR: {type(e).__name__}", 0.0, 0.0))
+    wall_s = time.perf_counter() - wall_start
+
+    states: Dict[str, int] = {}
+    for state, _, _ in outcomes:
+        states[state] = states.get(state, 0) + 1
+    completed = [o for o in outcomes if o[0] == "SUCCESS"]
+
+    payload = {
+        "config": {
+            "base_url": base_url,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "pages": args.pages,
+            "tables_per_page": args.tables_per_page,
+            "images_per_page": args.images_per_page,
+            "document_bytes": len(pdf_bytes),
+        },
+        "states": states,
+        "wall_time_s": round(wall_s, 3),
+        "throughput_docs_per_s": round(len(completed) / wall_s, 3) if wall_s else None,
+        "submit_latency_s": summarize([o[1] for o in outcomes if o[1]]),
+        "end_to_end_latency_s": summarize([o[2] for o in completed]),
+    }
+    print(json.dumps({k: payload[k] for k in ("states", "wall_time_s", "throughput_docs_per_s")}))
+    print(f"Results written to {write_results('load', payload, args.output)}")
+
+
+if __name__ == "__main__":
+    main()
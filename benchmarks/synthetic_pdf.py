@@ -0,0 +1,130 @@
+"""Synthetic financial PDF generator for benchmarks.
+
+Pages carry a report-style narrative, ruled financial tables (detectable by
+``page.find_tables()``) and embedded raster images, with tunable density:
+
+    python benchmarks/synthetic_pdf.py out.pdf --pages 40 --tables-per-page 2 --images-per-page 1
+"""
+
+import argparse
+import random
+from typing import Optional
+
+import fitz  # PyMuPDF
+
+PAGE_WIDTH, PAGE_HEIGHT = fitz.paper_size("letter")
+MARGIN = 54
+LINE_HEIGHT = 13
+
+NARRATIVE = [
+    "Revenue increased {pct}% year over year to ${amount} million, driven by subscription growth.",
+    "Net income was ${amount} million, while operating income reached ${amount2} million.",
+    "EBITDA margin expanded to {pct}% on lower fulfilment costs and improved pricing.",
+    "Total debt stood at ${amount} million; management expects to remain within covenant limits.",
+    "Market volatility and foreign exchange fluctuation reduced reported sales by {pct}%.",
+    "Liquidity remains strong with ${amount} million in cash and available credit facilities.",
+    "Credit risk from customer default increased modestly; the loan loss provision rose {pct}%.",
+    "Operational risk from system migration and technology upgrades is being monitored.",
+    "Regulatory compliance costs rose as new government policy took effect during the quarter.",
+    "The decline in trading volumes led to a decrease in commission income of {pct}%.",
+]
+
+TABLE_ROWS = ["Revenue", "Cost of sales", "Gross profit", "Operating expenses", "Operating income",
+              "Interest expense", "Net income", "Total assets", "Total liabilities", "Cash"]
+
+
+def _narrative_line(rng: random.Random) -> str:
+    return rng.choice(NARRATIVE).format(
+        pct=rng.randint(1, 40),
+        amount=f"{rng.uniform(10, 9000):,.1f}",
+        amount2=f"{rng.uniform(10, 900):,.1f}",
+    )
+
+
+def _draw_table(page: fitz.Page, top: float, rng: random.Random, rows: int = 6, cols: int = 4) -> float:
+    """Draw a ruled table starting at `top`; returns the y coordinate below it."""
+    col_width = (PAGE_WIDTH - 2 * MARGIN) / cols
+    row_height = 16
+    headers = ["Line item"] + [f"FY{2020 + i}" for i in range(cols - 1)]
+    for r in range(rows + 1):
+        for c in range(cols):
+            rect = fitz.Rect(
+                MARGIN + c * col_width, top + r * row_height,
+                MARGIN + (c + 1) * col_width, top + (r + 1) * row_height,
+            )
+            page.draw_rect(rect, color=(0, 0, 0), width=0.5)
+            if r == 0:
+                text = headers[c]
+            elif c == 0:
+                text = TABLE_ROWS[(r - 1) % len(TABLE_ROWS)]
+            else:
+                text = f"{rng.uniform(-500, 5000):,.1f}"
+            page.insert_text((rect.x0 + 3, rect.y1 - 4), text, fontsize=8)
+    return top + (rows + 1) * row_height + 12
+
+
+def _make_image(rng: random.Random, width: int, height: int) -> fitz.Pixmap:
+    """A noisy RGB chart-like image (deterministic for a given rng)."""
+    samples = bytes(rng.getrandbits(8) for _ in range(width * height * 3))
+    return fitz.Pixmap(fitz.csRGB, width, height, samples, False)
+
+
+def generate_financial_pdf(
+    path: str,
+    pages: int = 10,
+    tables_per_page: int = 1,
+    images_per_page: int = 0,
+    lines_per_page: int = 20,
+    image_size: int = 128,
+    seed: Optional[int] = 0,
+) -> str:
+    """Write a synthetic financial report to `path` and return the path."""
+    rng = random.Random(seed)
+    doc = fitz.open()
+    image = _make_image(rng, image_size, image_size) if images_per_page else None
+    for page_num in range(pages):
+        page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+        y = MARGIN
+        page.insert_text((MARGIN, y), f"Quarterly Financial Report - Section {page_num + 1}", fontsize=14)
+        y += 2 * LINE_HEIGHT
+        for _ in range(lines_per_page):
+            page.insert_text((MARGIN, y), _narrative_line(rng), fontsize=9)
+            y += LINE_HEIGHT
+        for _ in range(tables_per_page):
+            if y + 140 > PAGE_HEIGHT - MARGIN:
+                break
+            y = _draw_table(page, y, rng)
+        for i in range(images_per_page):
+            size = 72
+            x = MARGIN + (i % 6) * (size + 6)
+            row_y = y + (i // 6) * (size + 6)
+            if row_y + size > PAGE_HEIGHT - MARGIN:
+                break
+            page.insert_image(fitz.Rect(x, row_y, x + size, row_y + size), pixmap=image)
+    doc.save(path, garbage=3, deflate=True)
+    doc.close()
+    return path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path")
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--tables-per-page", type=int, default=1)
+    parser.add_argument("--images-per-page", type=int, default=0)
+    parser.add_argument("--lines-per-page", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    generate_financial_pdf(
+        args.path,
+        pages=args.pages,
+        tables_per_page=args.tables_per_page,
+        images_per_page=args.images_per_page,
+        lines_per_page=args.lines_per_page,
+        seed=args.seed,
+    )
+    print(f"Wrote {args.pages}-page synthetic report to {args.path}")
+
+
+if __name__ == "__main__":
+    main()
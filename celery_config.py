@@ -3,6 +3,7 @@
 import os
 from celery import Celery
 from conf import settings
+from telemetry import instrument_celery
 
 # Create Celery app
 celery_app = Celery(
@@ -23,9 +24,14 @@ celery_app.conf.update(
     task_time_limit=30 * 60,  # 30 minutes
     task_soft_time_limit=25 * 60,  # 25 minutes
     worker_prefetch_multiplier=1,
-    worker_max_tasks_per_child=1000,
+    # Recycle prefork children by memory, not task count: a child whose RSS high-water
+    # mark exceeds the budget (in KiB) is replaced after its current task
+    worker_max_memory_per_child=settings.WORKER_MAX_MEMORY_PER_CHILD_MB * 1024,
 )
 
+# Trace enqueue/dequeue and carry trace context in task headers
+instrument_celery()
+
 # Optional: Configure routing
 celery_app.conf.task_routes = {
     'simple_celery_tasks.analyze_financial_document_task': {'queue': 'financial_analysis'},
@@ -1,15 +1,50 @@
+from typing import Literal
+from pydantic import model_validator
 from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
     
-    GEMINI_API_KEY: str
+    GEMINI_API_KEY: str = ""
     GEMINI_MODEL: str = "gemini/gemini-2.0-flash"
-    SERPER_API_KEY: str
+    SERPER_API_KEY: str = ""
     REDIS_HOST: str
     REDIS_PORT: int
     REDIS_PASSWORD: str
     MONGO_URI: str
+    SEARCH_INDEX_PATH: str = "index/search.db"
+    RESULT_CACHE_SIZE: int = 512
+    RESULT_CACHE_MAX_AGE: int = 3600
+    OTEL_TRACES_EXPORTER: str = "none"  # otlp | file | console | none
+    OTEL_EXPORTER_OTLP_ENDPOINT: str = "http://localhost:4318/v1/traces"
+    OTEL_TRACES_FILE: str = "outputs/traces.jsonl"
+    # LLM/search providers: live | record | replay | synthetic (see providers.py)
+    PROVIDER_MODE: Literal["live", "record", "replay", "synthetic"] = "live"
+    PROVIDER_CASSETTE_DIR: str = "cassettes"
+    SYNTHETIC_LLM_LATENCY_MS: float = 800.0
+    SYNTHETIC_LLM_LATENCY_SIGMA: float = 0.3
+    SYNTHETIC_LLM_COMPLETION_TOKENS: int = 400
+    SYNTHETIC_LLM_TOKENS_SIGMA: float = 0.3
+    SYNTHETIC_SEARCH_LATENCY_MS: float = 300.0
+    SYNTHETIC_SEARCH_LATENCY_SIGMA: float = 0.3
+    SYNTHETIC_SEED: int = 0
+    # Memory: prefork children are recycled once their RSS high-water mark passes this
+    WORKER_MAX_MEMORY_PER_CHILD_MB: int = 1536
+    TASK_MEMORY_SAMPLE_INTERVAL_S: float = 0.1
+    TASK_TRACEMALLOC: bool = False  # Python heap peak per task; slows allocation-heavy extraction several-fold
+    PDF_EXTRACTION_MEMORY_BUDGET_MB: int = 768
+    PDF_TRIM_GROWTH_MB: int = 256
+    PDF_MAX_CONCURRENT_PIXMAPS: int = 2
+    PDF_MAX_IMAGE_MEGAPIXELS: float = 25.0
+
+    @model_validator(mode="after")
+    def require_live_api_keys(self):
+        # Replay and synthetic providers run offline, so the keys are only needed otherwise
+        if self.PROVIDER_MODE in ("live", "record"):
+            missing = [name for name in ("GEMINI_API_KEY", "SERPER_API_KEY") if not getattr(self, name)]
+            if missing:
+                raise ValueError(f"{', '.join(missing)} required when PROVIDER_MODE={self.PROVIDER_MODE}")
+        return self
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,91 @@
+"""Tracing for crew tasks and LLM calls (worker-only: imports crewai)."""
+
+import time
+from typing import Any, Dict, List, Optional, Union
+from crewai import LLM
+from crewai.utilities.events import crewai_event_bus, TaskStartedEvent, TaskCompletedEvent, TaskFailedEvent
+from opentelemetry import context, trace
+from opentelemetry.trace import Status, StatusCode
+from telemetry import tracer, stage, record_llm_tokens, STAGE_DURATION
+
+
+class UsageRecorder:
+    """
+    LiteLLM-style callback crewai invokes synchronously with {"usage": ...} after each completion.
+    LiteLLM may also call it from its logging thread with the raw response; those calls are ignored.
+    """
+
+    def __init__(self):
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+    def log_success_event(self, kwargs, response_obj, start_time, end_time):
+        if not isinstance(response_obj, dict) or not response_obj.get("usage"):
+            return
+        usage = response_obj["usage"]
+        self.prompt_tokens += getattr(usage, "prompt_tokens", 0) or 0
+        self.completion_tokens += getattr(usage, "completion_tokens", 0) or 0
+
+
+class TracedLLM(LLM):
+    """crewai LLM that records a span, latency and token counts for every call."""
+
+    def call(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+    ) -> Union[str, Any]:
+        usage = UsageRecorder()
+        with stage("llm.call", model=self.model) as span:
+            try:
+                return super().call(
+                    messages,
+                    tools=tools,
+                    callbacks=[*(callbacks or []), usage],
+                    available_functions=available_functions,
+                )
+            finally:
+                span.set_attribute("llm.usage.prompt_tokens", usage.prompt_tokens)
+                span.set_attribute("llm.usage.completion_tokens", usage.completion_tokens)
+                record_llm_tokens(self.model, usage.prompt_tokens, usage.completion_tokens)
+
+
+# Crew task spans are opened/closed from crewai's event bus, which emits synchronously
+# in the thread running the task, so LLM and tool spans nest under them.
+_task_spans: Dict[int, Any] = {}
+
+
+@crewai_event_bus.on(TaskStartedEvent)
+def _on_task_started(source, event):
+    task = event.task or source
+    agent = getattr(task, "agent", None)
+    span = tracer.start_span(
+        "crew.task",
+        attributes={"crew.task.name": getattr(task, "name", None) or "", "crew.agent.role": getattr(agent, "role", "") or ""},
+    )
+    token = context.attach(trace.set_span_in_context(span))
+    _task_spans[id(task)] = (span, token, time.perf_counter())
+
+
+def _end_task_span(task, error: Optional[str] = None):
+    entry = _task_spans.pop(id(task), None)
+    if entry is None:
+        return
+    span, token, start = entry
+    if error is not None:
+        span.set_status(Status(StatusCode.ERROR, error))
+    STAGE_DURATION.labels(stage="crew.task").observe(time.perf_counter() - start)
+    context.detach(token)
+    span.end()
+
+
+@crewai_event_bus.on(TaskCompletedEvent)
+def _on_task_completed(source, event):
+    _end_task_span(event.task or source)
+
+
+@crewai_event_bus.on(TaskFailedEvent)
+def _on_task_failed(source, event):
+    _end_task_span(event.task or source, event.error)
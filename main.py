@@ -1,28 +1,60 @@
-from fastapi import FastAPI, File, UploadFile, Form, HTTPException
+from fastapi import FastAPI, File, UploadFile, Form, HTTPException, Query, Header, Request
+from fastapi.responses import JSONResponse, Response
+from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from celery.result import AsyncResult
 import os
+import time
 import uuid
-from crewai import Crew, Process
-from agents import financial_analyst, investment_advisor, risk_assessor, verifier
-from task import analyze_financial_document, investment_analysis, risk_assessment, verification
-from simple_celery_tasks import analyze_document_task
+from datetime import datetime
+from typing import Optional
+from simple_celery_tasks import analyze_document_task, load_crew_components
 from celery_config import celery_app
 from mongo_storage import mongo_storage
+from search_index import search_index
+from response_cache import result_cache, make_etag, etag_matches
+from conf import settings
+from telemetry import configure_tracing, tracer_provider, stage, render_metrics, metrics_registry, QueueDepthCollector, HTTP_REQUEST_DURATION
+
+configure_tracing("financial-document-analyzer-api")
 
 app = FastAPI(title="Financial Document Analyzer")
+FastAPIInstrumentor.instrument_app(app, excluded_urls="metrics", tracer_provider=tracer_provider())
+
+metrics_registry().register(
+    QueueDepthCollector(celery_app, ["celery", *(route["queue"] for route in celery_app.conf.task_routes.values())])
+)
+
+
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        # Label by route template, not raw path, to keep cardinality bounded
+        route = request.scope.get("route")
+        HTTP_REQUEST_DURATION.labels(
+            method=request.method,
+            route=getattr(route, "path", "unmatched"),
+            status=str(status),
+        ).observe(time.perf_counter() - start)
 
 
 def run_crew(query: str, file_path: str = "data/sample.pdf"):
     """To run the whole crew synchronously (debugging)"""
-    financial_crew = Crew(
-        agents=[financial_analyst, investment_advisor, risk_assessor, verifier],
-        tasks=[analyze_financial_document, investment_analysis, risk_assessment, verification],
-        process=Process.sequential,
+    crew = load_crew_components()
+    financial_crew = crew.Crew(
+        agents=crew.agents,
+        tasks=crew.tasks,
+        process=crew.Process.sequential,
     )
 
     inputs = {
         'query': query,
-        'file_path': file_path
+        'path': file_path
     }
 
     result = financial_crew.kickoff(inputs=inputs)
@@ -48,9 +80,10 @@ async def analyze_financial_documents(
         os.makedirs("data", exist_ok=True)
 
         # Save uploaded file
-        with open(file_path, "wb") as f:
-            content = await file.read()
-            f.write(content)
+        with stage("upload.save", filename=file.filename or ""):
+            with open(file_path, "wb") as f:
+                content = await file.read()
+                f.write(content)
 
         if not query:
             query = "Analyze this financial document for investment insights"
@@ -100,7 +133,8 @@ async def get_task_status(task_id: str):
 async def get_all_results():
     """Get all analysis results from MongoDB."""
     try:
-        results = list(mongo_storage.collection.find({}).sort('created_at', -1))
+        with stage("mongo.find_all"):
+            results = list(mongo_storage.collection.find({}).sort('created_at', -1))
         for result in results:
             result['_id'] = str(result['_id'])
         return {"status": "success", "count": len(results), "results": results}
@@ -109,20 +143,60 @@ async def get_all_results():
 
 
 @app.get("/results/{session_id}")
-async def get_result_by_session(session_id: str):
-    """Get analysis result by session ID."""
+async def get_result_by_session(session_id: str, if_none_match: Optional[str] = Header(default=None)):
+    """Get analysis result by session ID.
+
+    Results are immutable once written, so the serialized response is kept in an
+    in-process LRU and served with a strong ETag; a matching If-None-Match gets a 304.
+    """
     try:
-        result = mongo_storage.get_result(session_id)
-        if result:
-            return {"status": "success", "result": result}
-        else:
-            raise HTTPException(status_code=404, detail="Result not found for this session ID")
+        cached = result_cache.get(session_id)
+        if cached is None:
+            result = mongo_storage.get_result(session_id)
+            if not result:
+                raise HTTPException(status_code=404, detail="Result not found for this session ID")
+            body = JSONResponse({"status": "success", "result": result}).body
+            cached = (make_etag(result["_id"], body), body)
+            result_cache.put(session_id, *cached)
+
+        etag, body = cached
+        headers = {
+            "ETag": etag,
+            "Cache-Control": f"private, max-age={settings.RESULT_CACHE_MAX_AGE}, immutable",
+        }
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting result: {str(e)}")
 
 
+@app.get("/search")
+async def search_results(
+    q: str = Query(..., min_length=1, description="Full-text query"),
+    filename: Optional[str] = Query(default=None, description="Case-insensitive filename substring"),
+    date_from: Optional[datetime] = Query(default=None, description="Only results created at or after this time (UTC)"),
+    date_to: Optional[datetime] = Query(default=None, description="Only results created at or before this time (UTC)"),
+    page: int = Query(default=1, ge=1),
+    page_size: int = Query(default=10, ge=1, le=100),
+):
+    """Search stored analyses (document text and crew output) ranked by BM25."""
+    try:
+        hits = search_index.search(q, filename=filename, date_from=date_from, date_to=date_to, page=page, page_size=page_size)
+        return {"status": "success", "query": q, **hits}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error searching results: {str(e)}")
+
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus metrics (request/stage latency histograms, queue depth, LLM tokens)."""
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
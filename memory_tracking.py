@@ -0,0 +1,92 @@
+"""Process memory measurement for Celery tasks (RSS high-water marks and tracemalloc peaks)."""
+
+import ctypes
+import gc
+import os
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Any, Dict, Optional
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def peak_rss_mb() -> float:
+    """Lifetime RSS high-water mark of this process (what Celery's max_memory_per_child checks)."""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # KiB on Linux, bytes on macOS
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def current_rss_mb() -> float:
+    """Current resident set size; falls back to the high-water mark where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        return peak_rss_mb()
+
+
+def trim_memory() -> None:
+    """Collect garbage and hand freed heap pages back to the OS (glibc only)."""
+    gc.collect()
+    try:
+        ctypes.CDLL("libc.so.6").malloc_trim(0)
+    except (OSError, AttributeError):
+        pass
+
+
+class MemoryTracker:
+    """
+    Measure one task's memory: RSS at start/end, the RSS high-water mark (sampled in a
+    background thread, since the process-wide peak never resets) and, optionally, the
+    tracemalloc peak of Python allocations.
+    """
+
+    def __init__(self, sample_interval: float = 0.1, trace_python: bool = False):
+        self.sample_interval = sample_interval
+        self.trace_python = trace_python
+        self.report: Dict[str, Any] = {}
+        self._peak = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started_tracemalloc = False
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.sample_interval):
+            self._peak = max(self._peak, current_rss_mb())
+
+    def __enter__(self) -> "MemoryTracker":
+        self._start_time = time.perf_counter()
+        self._start_rss = current_rss_mb()
+        self._peak = self._start_rss
+        if self.trace_python and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._thread = threading.Thread(target=self._sample, name="memory-tracker", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+        end_rss = current_rss_mb()
+        self._peak = max(self._peak, end_rss)
+
+        python_peak = None
+        if self._started_tracemalloc:
+            _, traced_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()  # also frees the trace tables
+            python_peak = round(traced_peak / (1024 * 1024), 2)
+
+        self.report = {
+            "rss_start_mb": round(self._start_rss, 2),
+            "rss_end_mb": round(end_rss, 2),
+            "rss_peak_mb": round(self._peak, 2),
+            "rss_growth_mb": round(end_rss - self._start_rss, 2),
+            "process_peak_rss_mb": round(peak_rss_mb(), 2),
+            "python_peak_mb": python_peak,
+            "duration_s": round(time.perf_counter() - self._start_time, 3),
+        }
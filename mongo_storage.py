@@ -6,28 +6,56 @@ from pymongo.server_api import ServerApi
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from conf import settings
+from telemetry import stage
 
 
 class MongoStorage:
     def __init__(self):
-        # Connect to MongoDB using server API v1 (works with Atlas)
-        self.client = MongoClient(settings.MONGO_URI, server_api=ServerApi("1"))
+        # The client is created on first use so importing this module (API startup,
+        # each Celery child) doesn't pay for connection setup and index creation.
+        self._client = None
+        self._collection = None
+
+    @property
+    def client(self) -> MongoClient:
+        if self._client is None:
+            # Connect to MongoDB using server API v1 (works with Atlas)
+            self._client = MongoClient(settings.MONGO_URI, server_api=ServerApi("1"))
+        return self._client
+
+    @property
+    def db(self):
         # Database name (you can change)
-        self.db = self.client["financial_analyzer"]
-        # Collection name
-        self.collection = self.db["results"]
+        return self.client["financial_analyzer"]
+
+    @property
+    def collection(self):
+        if self._collection is None:
+            # Collection name
+            collection = self.db["results"]
 
-        # Optional: create an index on session_id for faster lookups and uniqueness
-        try:
-            self.collection.create_index("session_id", unique=True)
-        except Exception:
-            # index creation isn't critical at runtime; ignore errors here
-            pass
+            # Optional: create an index on session_id for faster lookups and uniqueness
+            try:
+                with stage("mongo.create_index"):
+                    collection.create_index("session_id", unique=True)
+            except Exception:
+                # index creation isn't critical at runtime; ignore errors here
+                pass
+            self._collection = collection
+        return self._collection
 
-    def save_result(self, session_id: str, query: str, output: str, filename: str) -> str:
+    def save_result(
+        self,
+        session_id: str,
+        query: str,
+        output: str,
+        filename: str,
+        memory: Optional[Dict[str, Any]] = None,
+    ) -> str:
         """
         Save the analysis result document and return the inserted_id as string.
         If a document with the same session_id already exists, this will insert another doc.
+        `memory` is the worker's memory report for this document, if measured.
         """
         document = {
             "session_id": session_id,
@@ -36,12 +64,16 @@ class MongoStorage:
             "output": output,
             "created_at": datetime.utcnow(),
         }
-        result = self.collection.insert_one(document)
+        if memory is not None:
+            document["memory"] = memory
+        with stage("mongo.save_result"):
+            result = self.collection.insert_one(document)
         return str(result.inserted_id)
 
     def get_result(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Return a single result document by session_id, or None if not found."""
-        doc = self.collection.find_one({"session_id": session_id})
+        with stage("mongo.get_result"):
+            doc = self.collection.find_one({"session_id": session_id})
         if not doc:
             return None
         # Convert ObjectId to string for JSON serialization
@@ -53,13 +85,14 @@ class MongoStorage:
 
     def get_all(self, limit: int = 100) -> List[Dict[str, Any]]:
         """Return a list of result documents sorted by created_at desc (limited)."""
-        cursor = self.collection.find({}).sort("created_at", -1).limit(limit)
-        docs = []
-        for d in cursor:
-            d["_id"] = str(d["_id"])
-            if "created_at" in d and hasattr(d["created_at"], "isoformat"):
-                d["created_at"] = d["created_at"].isoformat() + "Z"
-            docs.append(d)
+        with stage("mongo.get_all"):
+            cursor = self.collection.find({}).sort("created_at", -1).limit(limit)
+            docs = []
+            for d in cursor:
+                d["_id"] = str(d["_id"])
+                if "created_at" in d and hasattr(d["created_at"], "isoformat"):
+                    d["created_at"] = d["created_at"].isoformat() + "Z"
+                docs.append(d)
         return docs
 
 
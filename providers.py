@@ -0,0 +1,314 @@
+"""Pluggable LLM and web-search providers (worker-only: imports crewai).
+
+Settings.PROVIDER_MODE selects how the crew talks to Gemini and Serper:
+
+- live: call the real services (default)
+- record: call the real services and save every exchange to PROVIDER_CASSETTE_DIR
+- replay: answer from recorded exchanges only; a missing recording is an error
+- synthetic: generate responses locally with configurable latency and token counts
+
+Replay and synthetic need no network or API keys, so the full crew can be load
+tested offline and deterministically.
+"""
+
+import ast
+import hashlib
+import json
+import math
+import os
+import random
+import re
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
+from crewai.llms.base_llm import BaseLLM
+from crewai_tools import SerperDevTool
+from conf import settings
+from crew_telemetry import TracedLLM, UsageRecorder
+from telemetry import stage, record_llm_tokens
+
+OFFLINE_MODES = ("replay", "synthetic")
+
+UUID_PATTERN = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE)
+
+# crewai describes each tool to a ReAct agent in the prompt as "Tool Name: ...\nTool Arguments: {...}"
+TOOL_PATTERN = re.compile(r"^Tool Name: (.+)\nTool Arguments: (\{.*\})$", re.MULTILINE)
+DELEGATION_TOOLS = ("Delegate work to coworker", "Ask question to coworker")
+PDF_PATH_PATTERN = re.compile(r"[^\s'\"]+\.pdf\b")
+
+SYNTHETIC_VOCABULARY = (
+    "revenue margin liquidity leverage covenant cash flow earnings guidance volatility exposure "
+    "credit default capital reserves growth decline operating expenses dividend valuation outlook "
+    "compliance disclosure risk moderate elevated stable balance sheet debt equity quarter fiscal"
+).split()
+
+
+class CassetteMissError(RuntimeError):
+    """Raised in replay mode when no recording exists for a request."""
+
+
+def _normalize(value: Any) -> Any:
+    # Upload paths and session ids embed random UUIDs; mask them so the same
+    # document and query map to the same recording across runs.
+    if isinstance(value, str):
+        return UUID_PATTERN.sub("<uuid>", value)
+    if isinstance(value, dict):
+        return {k: _normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    return value
+
+
+def request_key(payload: Dict[str, Any]) -> str:
+    """Stable hash of a normalized request payload."""
+    canonical = json.dumps(_normalize(payload), sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class Cassette:
+    """Recorded provider exchanges stored as one JSON file per request under `<directory>/<kind>/`."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def _path(self, kind: str, key: str) -> str:
+        return os.path.join(self.directory, kind, f"{key}.json")
+
+    def load(self, kind: str, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(kind, key), encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def save(self, kind: str, key: str, entry: Dict[str, Any]) -> None:
+        path = self._path(kind, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write-then-rename so concurrent workers never read a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entry, f, indent=2, ensure_ascii=False, default=str)
+        os.replace(tmp_path, path)
+
+
+def _seeded_rng(key: str) -> random.Random:
+    # Per-request seed: identical requests get identical samples regardless of
+    # worker, concurrency or call order.
+    return random.Random(f"{settings.SYNTHETIC_SEED}:{key}")
+
+
+def _lognormal(rng: random.Random, mean: float, sigma: float) -> float:
+    """Sample a lognormal with the given mean (not median) and shape."""
+    if mean <= 0:
+        return 0.0
+    if sigma <= 0:
+        return mean
+    return rng.lognormvariate(math.log(mean) - sigma ** 2 / 2, sigma)
+
+
+def _prompt_chars(messages: Union[str, List[Dict[str, str]]]) -> int:
+    if isinstance(messages, str):
+        return len(messages)
+    return sum(len(str(m.get("content", ""))) for m in messages)
+
+
+def _offered_tool(messages: Union[str, List[Dict[str, str]]]) -> Optional[Tuple[str, List[str]]]:
+    """
+    The agent's own tool (name and argument names) if this is the agent's first turn, else None.
+    Once crewai has appended an assistant turn (a tool call and its observation) the agent should answer.
+    """
+    if isinstance(messages, str) or any(m.get("role") == "assistant" for m in messages):
+        return None
+    for m in messages:
+        for name, arguments in TOOL_PATTERN.findall(str(m.get("content", ""))):
+            if name not in DELEGATION_TOOLS:
+                try:
+                    return name, list(ast.literal_eval(arguments))
+                except (ValueError, SyntaxError):
+                    return name, []
+    return None
+
+
+def _tool_arguments(argument_names: List[str], messages: List[Dict[str, str]], rng: random.Random) -> Dict[str, str]:
+    """Fill a tool call the way a model would: paths from the prompt, short search queries, otherwise the task prompt."""
+    prompt = "\n".join(str(m.get("content", "")) for m in messages)
+    task_prompt = next((str(m.get("content", "")) for m in reversed(messages) if m.get("role") == "user"), prompt)
+    arguments = {}
+    for name in argument_names:
+        if "path" in name:
+            match = PDF_PATH_PATTERN.search(prompt)
+            arguments[name] = match.group(0) if match else ""
+        elif "query" in name:
+            arguments[name] = " ".join(rng.choice(SYNTHETIC_VOCABULARY) for _ in range(6))
+        else:
+            arguments[name] = task_prompt
+    return arguments
+
+
+class RecordReplayLLM(TracedLLM):
+    """Gemini LLM that records exchanges to a cassette or replays them without network access."""
+
+    def __init__(self, mode: str, cassette: Cassette, **kwargs):
+        super().__init__(**kwargs)
+        self.mode = mode
+        self.cassette = cassette
+
+    def call(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+    ) -> Union[str, Any]:
+        request = {"model": self.model, "messages": messages, "tools": tools}
+        key = request_key(request)
+
+        if self.mode == "replay":
+            with stage("llm.call", model=self.model, replayed=True) as span:
+                entry = self.cassette.load("llm", key)
+                if entry is None:
+                    raise CassetteMissError(f"No recorded LLM response for request {key}")
+                usage = entry.get("usage", {})
+                span.set_attribute("llm.usage.prompt_tokens", usage.get("prompt_tokens", 0))
+                span.set_attribute("llm.usage.completion_tokens", usage.get("completion_tokens", 0))
+                record_llm_tokens(self.model, usage.get("prompt_tokens", 0), usage.get("completion_tokens", 0))
+                return entry["response"]
+
+        usage = UsageRecorder()
+        start = time.perf_counter()
+        response = super().call(
+            messages,
+            tools=tools,
+            callbacks=[*(callbacks or []), usage],
+            available_functions=available_functions,
+        )
+        # Native function-calling results aren't plain text; only text answers are replayable
+        if isinstance(response, str):
+            self.cassette.save("llm", key, {
+                "request": _normalize(request),
+                "response": response,
+                "usage": {"prompt_tokens": usage.prompt_tokens, "completion_tokens": usage.completion_tokens},
+                "latency_s": round(time.perf_counter() - start, 3),
+            })
+        return response
+
+
+class SyntheticLLM(BaseLLM):
+    """
+    Local stand-in for a ReAct model. On an agent's first turn it calls the agent's tool so the
+    tools run as they would live; after the observation (or with no tools) it gives a final answer.
+    Every call takes a sampled delay.
+    """
+
+    def __init__(self, model: str):
+        super().__init__(model=model)
+
+    def call(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+    ) -> Union[str, Any]:
+        key = request_key({"model": self.model, "messages": messages, "tools": tools})
+        rng = _seeded_rng(key)
+        with stage("llm.call", model=self.model, synthetic=True) as span:
+            latency_s = _lognormal(rng, settings.SYNTHETIC_LLM_LATENCY_MS, settings.SYNTHETIC_LLM_LATENCY_SIGMA) / 1000
+            completion_tokens = max(int(round(_lognormal(
+                rng, settings.SYNTHETIC_LLM_COMPLETION_TOKENS, settings.SYNTHETIC_LLM_TOKENS_SIGMA
+            ))), 1)
+            prompt_tokens = _prompt_chars(messages) // 4  # ~4 characters per token
+            time.sleep(latency_s)
+
+            tool = _offered_tool(messages)
+            if tool is not None:
+                name, argument_names = tool
+                response = (
+                    f"Thought: I should use the {name} tool first\n"
+                    f"Action: {name}\n"
+                    f"Action Input: {json.dumps(_tool_arguments(argument_names, messages, rng), ensure_ascii=False)}"
+                )
+                completion_tokens = max(len(response) // 4, 1)
+            else:
+                # Roughly 0.75 words per token
+                words = [rng.choice(SYNTHETIC_VOCABULARY) for _ in range(max(int(completion_tokens * 0.75), 1))]
+                response = "Thought: I now can give a great answer\nFinal Answer: " + " ".join(words).capitalize() + "."
+            span.set_attribute("llm.usage.prompt_tokens", prompt_tokens)
+            span.set_attribute("llm.usage.completion_tokens", completion_tokens)
+            record_llm_tokens(self.model, prompt_tokens, completion_tokens)
+            return response
+
+    def get_context_window_size(self) -> int:
+        return 1_000_000
+
+
+class ProviderSearchTool(SerperDevTool):
+    """
+    Serper search with the same name, description and schema as SerperDevTool (so agent
+    prompts are identical in every mode), but recordable, replayable or synthetic.
+    """
+
+    mode: str = "live"
+    cassette_dir: str = ""
+
+    def _run(self, **kwargs: Any) -> Any:
+        search_query = kwargs.get("search_query") or kwargs.get("query")
+        if self.mode == "live":
+            return super()._run(**kwargs)
+
+        key = request_key({"search_query": search_query, "search_type": kwargs.get("search_type", self.search_type)})
+        cassette = Cassette(self.cassette_dir)
+        with stage("search.call", mode=self.mode):
+            if self.mode == "record":
+                result = super()._run(**kwargs)
+                cassette.save("search", key, {"request": _normalize(kwargs), "response": result})
+                return result
+            if self.mode == "replay":
+                entry = cassette.load("search", key)
+                if entry is None:
+                    raise CassetteMissError(f"No recorded search response for query {search_query!r}")
+                return entry["response"]
+
+            rng = _seeded_rng(key)
+            time.sleep(_lognormal(rng, settings.SYNTHETIC_SEARCH_LATENCY_MS, settings.SYNTHETIC_SEARCH_LATENCY_SIGMA) / 1000)
+            return {
+                "searchParameters": {"q": search_query, "type": "search", "num": self.n_results},
+                "organic": [
+                    {
+                        "title": f"{search_query} - result {i + 1}",
+                        "link": f"https://example.com/{key[:12]}/{i + 1}",
+                        "snippet": " ".join(rng.choice(SYNTHETIC_VOCABULARY) for _ in range(25)),
+                        "position": i + 1,
+                    }
+                    for i in range(self.n_results)
+                ],
+            }
+
+
+def build_llm():
+    """LLM for the agents according to PROVIDER_MODE."""
+    mode = settings.PROVIDER_MODE
+    if mode == "synthetic":
+        return SyntheticLLM(model=f"synthetic/{settings.GEMINI_MODEL}")
+    if mode in ("record", "replay"):
+        return RecordReplayLLM(
+            mode,
+            Cassette(settings.PROVIDER_CASSETTE_DIR),
+            model=settings.GEMINI_MODEL,
+            api_key=settings.GEMINI_API_KEY,
+        )
+    return TracedLLM(model=settings.GEMINI_MODEL, api_key=settings.GEMINI_API_KEY)
+
+
+def build_search_tool() -> SerperDevTool:
+    """Web search tool for the verifier according to PROVIDER_MODE."""
+    return ProviderSearchTool(
+        api_key=settings.SERPER_API_KEY,
+        mode=settings.PROVIDER_MODE,
+        cassette_dir=settings.PROVIDER_CASSETTE_DIR,
+    )
+
+
+def agent_max_rpm(live_limit: int) -> Optional[int]:
+    """Rate limits protect live API quotas; replayed and synthetic providers have none."""
+    return None if settings.PROVIDER_MODE in OFFLINE_MODES else live_limit
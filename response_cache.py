@@ -0,0 +1,69 @@
+"""In-process LRU cache of serialized API responses with ETag helpers."""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+from conf import settings
+
+
+def make_etag(resource_id: str, body: bytes) -> str:
+    """Strong ETag built from the stored result id and a hash of the serialized body."""
+    digest = hashlib.sha256(body).hexdigest()[:32]
+    return f'"{resource_id}-{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Evaluate an If-None-Match header against an ETag (weak comparison, as RFC 9110 requires for GET)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+class ResponseCache:
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[str, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Tuple[str, bytes]]:
+        """Return (etag, body) for a cached response and mark it most recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, etag: str, body: bytes) -> None:
+        """Store a serialized response, evicting the least recently used entry when full."""
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (etag, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Single global instance for easy import
+result_cache = ResponseCache(settings.RESULT_CACHE_SIZE)
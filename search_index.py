@@ -0,0 +1,215 @@
+"""Local full-text search index (SQLite FTS5, BM25 ranked) over stored financial analyses."""
+
+import os
+import re
+import sqlite3
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Any
+from conf import settings
+
+SNIPPET_LENGTH = 240
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:\.[0-9]+)?")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the this to was were will with".split()
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    doc_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    session_id TEXT NOT NULL UNIQUE,
+    filename TEXT,
+    query TEXT,
+    created_at TEXT NOT NULL,
+    snippet TEXT
+);
+-- Bodies are pre-tokenized by tokenize(); '.' is a token character so decimals like 3.5 stay whole.
+-- FTS5's bm25() uses the standard Okapi parameters (k1=1.2, b=0.75).
+CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(body, tokenize="unicode61 tokenchars '.'");
+CREATE INDEX IF NOT EXISTS idx_documents_created_at ON documents (created_at);
+"""
+
+
+def _isoformat_utc(value: datetime) -> str:
+    """
+    Render a datetime the way created_at is stored: UTC, ISO 8601 with microseconds and a Z suffix.
+    Every value has the same width, so string comparison orders them chronologically.
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.isoformat(timespec="microseconds") + "Z"
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase and split text into index terms, dropping common stopwords."""
+    if not text:
+        return []
+    return [t for t in TOKEN_PATTERN.findall(text.lower()) if t not in STOPWORDS]
+
+
+class SearchIndex:
+    def __init__(self, path: str):
+        # The file and schema are created on first use so importing this module
+        # (API startup, each Celery child) doesn't touch the filesystem.
+        self.path = path
+        self._initialized = False
+
+    def _initialize(self) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+        finally:
+            conn.close()
+        self._initialized = True
+
+    def _connect(self) -> sqlite3.Connection:
+        # One short-lived connection per call: the API and Celery workers
+        # live in different processes and share the index through the file.
+        if not self._initialized:
+            self._initialize()
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def add_document(
+        self,
+        session_id: str,
+        filename: str,
+        query: str,
+        output: str,
+        document_text: str = "",
+        created_at: Optional[datetime] = None,
+    ) -> int:
+        """
+        Index (or re-index) one analysis and return its internal doc_id.
+        The searchable body is the filename, query, crew output and extracted document text.
+        """
+        created_at = created_at or datetime.utcnow()
+        body = " ".join(tokenize(" ".join([filename or "", query or "", output or "", document_text or ""])))
+        snippet = re.sub(r"\s+", " ", output or "").strip()[:SNIPPET_LENGTH]
+
+        conn = self._connect()
+        try:
+            with conn:
+                existing = conn.execute(
+                    "SELECT doc_id FROM documents WHERE session_id = ?", (session_id,)
+                ).fetchone()
+                if existing:
+                    conn.execute("DELETE FROM documents_fts WHERE rowid = ?", (existing["doc_id"],))
+                    conn.execute("DELETE FROM documents WHERE doc_id = ?", (existing["doc_id"],))
+
+                cursor = conn.execute(
+                    "INSERT INTO documents (session_id, filename, query, created_at, snippet) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (session_id, filename, query, _isoformat_utc(created_at), snippet),
+                )
+                doc_id = cursor.lastrowid
+                conn.execute("INSERT INTO documents_fts (rowid, body) VALUES (?, ?)", (doc_id, body))
+            return doc_id
+        finally:
+            conn.close()
+
+    def remove_document(self, session_id: str) -> bool:
+        """Drop a session from the index. Returns True if it was present."""
+        conn = self._connect()
+        try:
+            with conn:
+                row = conn.execute(
+                    "SELECT doc_id FROM documents WHERE session_id = ?", (session_id,)
+                ).fetchone()
+                if not row:
+                    return False
+                conn.execute("DELETE FROM documents_fts WHERE rowid = ?", (row["doc_id"],))
+                conn.execute("DELETE FROM documents WHERE doc_id = ?", (row["doc_id"],))
+            return True
+        finally:
+            conn.close()
+
+    def search(
+        self,
+        q: str,
+        filename: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        page: int = 1,
+        page_size: int = 10,
+    ) -> Dict[str, Any]:
+        """
+        Rank documents matching any query term with BM25.
+        `filename` is a case-insensitive substring filter; `date_from`/`date_to` bound created_at (inclusive).
+        """
+        terms = list(dict.fromkeys(tokenize(q)))
+        page = max(page, 1)
+        page_size = max(page_size, 1)
+        empty = {"total": 0, "page": page, "page_size": page_size, "results": []}
+        if not terms:
+            return empty
+
+        # Any term may match; FTS5 scores with collection-wide statistics so filters don't shift ranks
+        match = " OR ".join(f'"{term}"' for term in terms)
+        where = "documents_fts MATCH ?"
+        params: List[Any] = [match]
+        if filename:
+            # instr() matches the text literally; LIKE would treat "_" and "%" as wildcards
+            where += " AND instr(LOWER(d.filename), ?) > 0"
+            params.append(filename.lower())
+        if date_from:
+            where += " AND d.created_at >= ?"
+            params.append(_isoformat_utc(date_from))
+        if date_to:
+            where += " AND d.created_at <= ?"
+            params.append(_isoformat_utc(date_to))
+
+        conn = self._connect()
+        try:
+            total = conn.execute(
+                f"SELECT COUNT(*) FROM documents_fts JOIN documents d ON d.doc_id = documents_fts.rowid WHERE {where}",
+                params,
+            ).fetchone()[0]
+            if not total:
+                return empty
+
+            # bm25() is lower-is-better; SQLite keeps only the requested page while sorting
+            rows = conn.execute(
+                "SELECT d.session_id, d.filename, d.query, d.created_at, d.snippet, bm25(documents_fts) AS bm25_score "
+                f"FROM documents_fts JOIN documents d ON d.doc_id = documents_fts.rowid WHERE {where} "
+                "ORDER BY bm25_score, d.doc_id DESC LIMIT ? OFFSET ?",
+                [*params, page_size, (page - 1) * page_size],
+            ).fetchall()
+            results = [
+                {
+                    "session_id": row["session_id"],
+                    "filename": row["filename"],
+                    "query": row["query"],
+                    "created_at": row["created_at"],
+                    "score": round(-row["bm25_score"], 4),
+                    "snippet": row["snippet"],
+                }
+                for row in rows
+            ]
+            return {"total": total, "page": page, "page_size": page_size, "results": results}
+        finally:
+            conn.close()
+
+
+# Single global instance for easy import
+search_index = SearchIndex(settings.SEARCH_INDEX_PATH)
+
+
+if __name__ == "__main__":
+    # Backfill the index from analyses already stored in MongoDB
+    from mongo_storage import mongo_storage
+
+    count = 0
+    for doc in mongo_storage.collection.find({}):
+        search_index.add_document(
+            doc["session_id"],
+            doc.get("filename", ""),
+            doc.get("query", ""),
+            doc.get("output", ""),
+            created_at=doc.get("created_at"),
+        )
+        count += 1
+    print(f"Indexed {count} stored analyses into {settings.SEARCH_INDEX_PATH}")
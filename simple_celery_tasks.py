@@ -2,25 +2,76 @@
 
 import os
 from datetime import datetime
+from types import SimpleNamespace
+from celery.signals import worker_init, worker_process_init
+from celery.utils.log import get_task_logger
 from celery_config import celery_app
 from mongo_storage import mongo_storage
-from crewai import Crew, Process
-from agents import financial_analyst, investment_advisor, risk_assessor, verifier
-from task import (
-    analyze_financial_document,
-    investment_analysis,
-    risk_assessment,
-    verification,
-)
+from search_index import search_index
+from telemetry import configure_tracing, stage, TASK_PEAK_RSS
+from memory_tracking import MemoryTracker, trim_memory
+from conf import settings
 
 # Ensure outputs folder exists
 OUTPUTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "outputs")
 os.makedirs(OUTPUTS_DIR, exist_ok=True)
 
+logger = get_task_logger(__name__)
+
+# crewai's built-in telemetry sends usage data to crewai's servers; keep it off
+# in workers unless it is explicitly enabled.
+os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+
+# crewai, the agents/tasks and the PDF tools are heavy to import and only needed
+# when a task actually runs. The API imports this module just to enqueue tasks, so
+# they are loaded on demand (and preloaded once per worker, see below).
+_crew_components = None
+
+
+def load_crew_components() -> SimpleNamespace:
+    """Import crewai, agents, tasks and tools once per process and return them."""
+    global _crew_components
+    if _crew_components is None:
+        from crewai import Crew, Process
+        from agents import financial_analyst, investment_advisor, risk_assessor, verifier
+        from task import (
+            analyze_financial_document,
+            investment_analysis,
+            risk_assessment,
+            verification,
+        )
+        from tools import extract_pdf_text
+
+        _crew_components = SimpleNamespace(
+            Crew=Crew,
+            Process=Process,
+            agents=[financial_analyst, investment_advisor, risk_assessor, verifier],
+            tasks=[analyze_financial_document, investment_analysis, risk_assessment, verification],
+            extract_pdf_text=extract_pdf_text,
+        )
+    return _crew_components
+
+
+@worker_init.connect
+def preload_crew_components(**kwargs):
+    # Runs in the worker's main process: the solo pool executes tasks there, and
+    # prefork children (including ones recycled by worker_max_memory_per_child) fork
+    # from it with the modules already imported.
+    configure_tracing("financial-document-analyzer-worker")
+    load_crew_components()
+
+
+@worker_process_init.connect
+def preload_crew_components_in_child(**kwargs):
+    # No-op when inherited from the parent; covers pools that don't fork from it.
+    configure_tracing("financial-document-analyzer-worker")
+    load_crew_components()
+
 
 @celery_app.task(name="simple_celery_tasks.analyze_document_task", bind=True)
 def analyze_document_task(self, session_id: str, query: str, file_path: str, filename: str):
     """Analyze financial document and save result to MongoDB and Markdown file."""
+    tracker = None
     try:
         # Update task status
         self.update_state(
@@ -29,17 +80,36 @@ def analyze_document_task(self, session_id: str, query: str, file_path: str, fil
         )
 
         # Process the financial document with all analysts
-        financial_crew = Crew(
-            agents=[financial_analyst, investment_advisor, risk_assessor, verifier],
-            tasks=[analyze_financial_document, investment_analysis, risk_assessment, verification],
-            process=Process.sequential,
+        crew = load_crew_components()
+        financial_crew = crew.Crew(
+            agents=crew.agents,
+            tasks=crew.tasks,
+            process=crew.Process.sequential,
         )
 
-        response = financial_crew.kickoff(inputs={"query": query, "path": file_path})
+        # Account memory per document: extraction and the crew run happen inside kickoff
+        tracker = MemoryTracker(settings.TASK_MEMORY_SAMPLE_INTERVAL_S, settings.TASK_TRACEMALLOC)
+        with stage("crew.kickoff", session_id=session_id) as span:
+            try:
+                with tracker:
+                    response = financial_crew.kickoff(inputs={"query": query, "path": file_path})
+            finally:
+                # Still inside the span, so the attribute lands on it (failed runs included)
+                if tracker.report:
+                    span.set_attribute("memory.rss_peak_mb", tracker.report["rss_peak_mb"])
         raw_output = str(getattr(response, "raw", response))
+        memory = tracker.report
+        TASK_PEAK_RSS.observe(memory["rss_peak_mb"])
 
         # Save result to MongoDB
-        result_id = mongo_storage.save_result(session_id, query, raw_output, filename)
+        result_id = mongo_storage.save_result(session_id, query, raw_output, filename, memory=memory)
+
+        # Add to the full-text search index; a failure here must not fail the analysis
+        try:
+            with stage("search_index.add"):
+                search_index.add_document(session_id, filename, query, raw_output, crew.extract_pdf_text(file_path))
+        except Exception:
+            logger.exception("Could not add session %s to the search index at %s", session_id, settings.SEARCH_INDEX_PATH)
 
         # Save Markdown file in outputs/
         md_file = os.path.join(OUTPUTS_DIR, f"{session_id}.md")
@@ -49,6 +119,7 @@ def analyze_document_task(self, session_id: str, query: str, file_path: str, fil
             f.write(f"**Query:** {query}\n\n")
             f.write(f"**Filename:** {filename}\n\n")
             f.write(f"**Created At:** {datetime.utcnow().isoformat()}Z\n\n")
+            f.write(f"**Peak Memory:** {memory['rss_peak_mb']} MB RSS\n\n")
             f.write("---\n\n")
             f.write(raw_output)
 
@@ -65,15 +136,23 @@ def analyze_document_task(self, session_id: str, query: str, file_path: str, fil
             "result_id": result_id,
             "analysis": raw_output[:300] + "..." if len(raw_output) > 300 else raw_output,
             "markdown_file": md_file,
+            "memory": memory,
         }
 
     except Exception as e:
+        # Failed documents are often the memory-hungry ones, so keep whatever was measured
+        memory = tracker.report if tracker is not None and tracker.report else None
+        if memory:
+            TASK_PEAK_RSS.observe(memory["rss_peak_mb"])
+
         # Save error report as Markdown
         err_file = os.path.join(OUTPUTS_DIR, f"{session_id}_error.md")
         with open(err_file, "w", encoding="utf-8") as f:
             f.write(f"# Error Report\n\n")
             f.write(f"**Session ID:** {session_id}\n\n")
             f.write(f"**Error:** {str(e)}\n\n")
+            if memory:
+                f.write(f"**Peak Memory:** {memory['rss_peak_mb']} MB RSS\n\n")
             f.write(f"**Created At:** {datetime.utcnow().isoformat()}Z\n")
 
         # Clean up uploaded file on error
@@ -88,4 +167,9 @@ def analyze_document_task(self, session_id: str, query: str, file_path: str, fil
             "session_id": session_id,
             "error": str(e),
             "error_file": err_file,
+            "memory": memory,
         }
+
+    finally:
+        # Hand back what the run freed so long-lived children don't ratchet upward
+        trim_memory()
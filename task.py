@@ -9,7 +9,8 @@ analyze_financial_document = Task(
 Conduct thorough analysis of financial statements, market data, and economic indicators.\n\
 Provide data-driven insights based on actual financial information from the document.\n\
 Identify key financial metrics, trends, and relevant market factors.\n\
-Ensure all analysis is factual, evidence-based, and follows regulatory compliance standards.",
+Ensure all analysis is factual, evidence-based, and follows regulatory compliance standards.\n\
+The uploaded document is located at: {path}",
 
     expected_output="""Provide a comprehensive financial analysis including:
 - Summary of key financial findings from the document
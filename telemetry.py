@@ -0,0 +1,266 @@
+"""OpenTelemetry tracing and Prometheus metrics shared by the API and Celery workers."""
+
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Optional, Tuple
+from opentelemetry import context, propagate, trace
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+from opentelemetry.trace import Status, StatusCode
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Histogram, generate_latest
+from prometheus_client.core import GaugeMetricFamily
+from conf import settings
+
+SERVICE_NAME = "financial-document-analyzer"
+
+# Buckets span sub-millisecond Mongo/cache hits up to multi-minute crew runs
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "fda_http_request_duration_seconds",
+    "API request latency",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+STAGE_DURATION = Histogram(
+    "fda_stage_duration_seconds",
+    "Latency of individual pipeline stages (PDF pages, OCR, crew tasks, LLM calls, Mongo operations)",
+    ["stage"],
+    buckets=LATENCY_BUCKETS,
+)
+QUEUE_WAIT = Histogram(
+    "fda_celery_queue_wait_seconds",
+    "Time between a task being enqueued by the API and a worker starting it",
+    ["task"],
+    buckets=LATENCY_BUCKETS,
+)
+TASK_DURATION = Histogram(
+    "fda_celery_task_duration_seconds",
+    "Celery task run time",
+    ["task", "state"],
+    buckets=LATENCY_BUCKETS,
+)
+TASK_PEAK_RSS = Histogram(
+    "fda_task_peak_rss_megabytes",
+    "RSS high-water mark of the worker process during each analysis",
+    buckets=(128, 256, 384, 512, 768, 1024, 1536, 2048, 3072, 4096, 8192),
+)
+LLM_TOKENS = Counter(
+    "fda_llm_tokens",
+    "LLM tokens consumed",
+    ["model", "kind"],
+)
+
+# Our spans go through a private provider, never the global one: crewai's own
+# telemetry installs a global provider that exports to crewai's servers, and
+# anything created from the global proxy tracer would follow it there.
+_provider: Optional[TracerProvider] = None
+_tracer: Optional[trace.Tracer] = None
+_tracing_configured = False
+
+
+def tracer_provider() -> TracerProvider:
+    """This process's tracer provider (span processors are added by configure_tracing)."""
+    global _provider
+    if _provider is None:
+        _provider = TracerProvider(resource=Resource.create({"service.name": SERVICE_NAME}))
+    return _provider
+
+
+class _ProviderTracer:
+    """Module-level `tracer` that resolves against tracer_provider() on first use, after configure_tracing has named the service."""
+
+    def __getattr__(self, name: str) -> Any:
+        global _tracer
+        if _tracer is None:
+            _tracer = tracer_provider().get_tracer("financial_document_analyzer")
+        return getattr(_tracer, name)
+
+
+tracer = _ProviderTracer()
+
+
+def configure_tracing(service_name: str) -> None:
+    """
+    Create this process's tracer provider once and attach the configured exporter.
+    OTEL_TRACES_EXPORTER selects "otlp" (HTTP to a local collector), "file" (JSON lines), "console" or "none"
+    (spans are dropped in-process; nothing is exported anywhere).
+    """
+    global _provider, _tracing_configured
+    if _tracing_configured:
+        return
+    _tracing_configured = True
+
+    if _provider is None:
+        _provider = TracerProvider(resource=Resource.create({"service.name": service_name}))
+
+    exporter_name = settings.OTEL_TRACES_EXPORTER.lower()
+    if exporter_name == "none":
+        return
+    if exporter_name == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+        exporter = OTLPSpanExporter(endpoint=settings.OTEL_EXPORTER_OTLP_ENDPOINT)
+    elif exporter_name == "file":
+        directory = os.path.dirname(os.path.abspath(settings.OTEL_TRACES_FILE))
+        os.makedirs(directory, exist_ok=True)
+        exporter = ConsoleSpanExporter(
+            out=open(settings.OTEL_TRACES_FILE, "a", encoding="utf-8"),
+            formatter=lambda span: span.to_json(indent=None) + os.linesep,
+        )
+    elif exporter_name == "console":
+        exporter = ConsoleSpanExporter()
+    else:
+        raise ValueError(f"Unknown OTEL_TRACES_EXPORTER: {settings.OTEL_TRACES_EXPORTER}")
+
+    _provider.add_span_processor(BatchSpanProcessor(exporter))
+
+
+@contextmanager
+def stage(name: str, **attributes: Any):
+    """Trace a pipeline stage as a span and record its latency in fda_stage_duration_seconds."""
+    start = time.perf_counter()
+    with tracer.start_as_current_span(name, attributes=attributes, record_exception=False, set_status_on_exception=False) as span:
+        try:
+            yield span
+        except Exception as e:
+            span.record_exception(e)
+            span.set_status(Status(StatusCode.ERROR, str(e)))
+            raise
+        finally:
+            STAGE_DURATION.labels(stage=name).observe(time.perf_counter() - start)
+
+
+def record_llm_tokens(model: str, prompt_tokens: int, completion_tokens: int) -> None:
+    LLM_TOKENS.labels(model=model, kind="prompt").inc(prompt_tokens)
+    LLM_TOKENS.labels(model=model, kind="completion").inc(completion_tokens)
+
+
+## Celery enqueue/dequeue instrumentation
+
+# Open spans keyed by task id: publish spans live between before/after_task_publish,
+# run spans between task_prerun/task_postrun (each pair fires in the same process).
+_publish_spans: Dict[str, Any] = {}
+_run_spans: Dict[str, Tuple[Any, object, float]] = {}
+
+
+def _on_before_task_publish(sender=None, headers=None, **kwargs):
+    if headers is None:
+        return
+    task_id = headers.get("id")
+    span = tracer.start_span(f"celery.enqueue {sender}", kind=trace.SpanKind.PRODUCER, attributes={"celery.task_id": task_id or ""})
+    _publish_spans[task_id] = span
+    # Trace context and enqueue time travel to the worker as task headers
+    propagate.inject(headers, context=trace.set_span_in_context(span))
+    headers["enqueued_at"] = time.time()
+
+
+def _on_after_task_publish(headers=None, **kwargs):
+    span = _publish_spans.pop((headers or {}).get("id"), None)
+    if span is not None:
+        span.end()
+
+
+def _on_task_prerun(task_id=None, task=None, **kwargs):
+    request = task.request
+    carrier = {key: getattr(request, key) for key in ("traceparent", "tracestate") if getattr(request, key, None)}
+    enqueued_at = getattr(request, "enqueued_at", None)
+    if enqueued_at:
+        QUEUE_WAIT.labels(task=task.name).observe(max(time.time() - float(enqueued_at), 0.0))
+
+    span = tracer.start_span(
+        f"celery.run {task.name}",
+        context=propagate.extract(carrier),
+        kind=trace.SpanKind.CONSUMER,
+        attributes={"celery.task_id": task_id},
+    )
+    token = context.attach(trace.set_span_in_context(span))
+    _run_spans[task_id] = (span, token, time.perf_counter())
+
+
+def _on_task_failure(task_id=None, exception=None, **kwargs):
+    entry = _run_spans.get(task_id)
+    if entry is not None and exception is not None:
+        entry[0].record_exception(exception)
+        entry[0].set_status(Status(StatusCode.ERROR, str(exception)))
+
+
+def _on_task_postrun(task_id=None, task=None, state=None, **kwargs):
+    entry = _run_spans.pop(task_id, None)
+    if entry is None:
+        return
+    span, token, start = entry
+    TASK_DURATION.labels(task=task.name, state=state or "UNKNOWN").observe(time.perf_counter() - start)
+    span.set_attribute("celery.state", state or "UNKNOWN")
+    context.detach(token)
+    span.end()
+
+
+def instrument_celery() -> None:
+    """Connect the Celery signal handlers that trace enqueue/dequeue and propagate trace context."""
+    from celery import signals
+
+    signals.before_task_publish.connect(_on_before_task_publish, weak=False)
+    signals.after_task_publish.connect(_on_after_task_publish, weak=False)
+    signals.task_prerun.connect(_on_task_prerun, weak=False)
+    signals.task_failure.connect(_on_task_failure, weak=False)
+    signals.task_postrun.connect(_on_task_postrun, weak=False)
+
+
+## /metrics
+
+class QueueDepthCollector:
+    """Reports the number of messages waiting in each broker queue at scrape time."""
+
+    def __init__(self, celery_app, queues: Iterable[str]):
+        self.celery_app = celery_app
+        self.queues = list(dict.fromkeys(queues))
+
+    def _family(self) -> GaugeMetricFamily:
+        return GaugeMetricFamily("fda_celery_queue_depth", "Messages waiting in the broker queue", labels=["queue"])
+
+    def describe(self):
+        # Without describe(), registering the collector would call collect() and hit the broker
+        yield self._family()
+
+    def collect(self):
+        gauge = self._family()
+        try:
+            with self.celery_app.connection_for_read(connect_timeout=2) as conn:
+                channel = conn.default_channel
+                for queue in self.queues:
+                    try:
+                        _, depth, _ = channel.queue_declare(queue=queue, passive=True)
+                    except Exception:
+                        depth = 0  # queue not declared yet (Redis drops empty lists)
+                    gauge.add_metric([queue], depth)
+        except Exception:
+            pass  # broker unreachable: omit samples rather than fail the scrape
+        yield gauge
+
+
+_metrics_registry: Optional[CollectorRegistry] = None
+
+
+def metrics_registry() -> CollectorRegistry:
+    """
+    Registry served by /metrics. With PROMETHEUS_MULTIPROC_DIR set (shared by the API and
+    the Celery workers on one host) it aggregates every process; otherwise it is this process's.
+    """
+    global _metrics_registry
+    if _metrics_registry is None:
+        if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+            from prometheus_client import multiprocess
+
+            _metrics_registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(_metrics_registry)
+        else:
+            _metrics_registry = REGISTRY
+    return _metrics_registry
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """Return the Prometheus exposition body and its content type."""
+    return generate_latest(metrics_registry()), CONTENT_TYPE_LATEST
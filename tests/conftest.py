@@ -0,0 +1,17 @@
+import os
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+# conf.Settings requires these; tests never connect to Redis or MongoDB
+for key, value in {
+    "REDIS_HOST": "localhost",
+    "REDIS_PORT": "6379",
+    "REDIS_PASSWORD": "",
+    "MONGO_URI": "mongodb://localhost:27017",
+    "GEMINI_API_KEY": "test",
+    "SERPER_API_KEY": "test",
+}.items():
+    os.environ.setdefault(key, value)
@@ -0,0 +1,74 @@
+import pytest
+
+from response_cache import ResponseCache, etag_matches, make_etag
+
+
+ETAG = '"abc-123"'
+
+
+@pytest.mark.parametrize("header", [
+    '"abc-123"',
+    "*",
+    " * ",
+    'W/"abc-123"',
+    '"other", "abc-123"',
+    '"other",W/"abc-123" ',
+])
+def test_etag_matches(header):
+    assert etag_matches(header, ETAG)
+
+
+@pytest.mark.parametrize("header", [None, "", '"other"', '"abc-12"', "abc-123", '"other", W/"abc"'])
+def test_etag_does_not_match(header):
+    assert not etag_matches(header, ETAG)
+
+
+def test_weak_etag_compares_weakly():
+    assert etag_matches('"abc-123"', 'W/"abc-123"')
+
+
+def test_make_etag_is_strong_and_content_addressed():
+    etag = make_etag("id1", b"body")
+    assert etag.startswith('"id1-') and etag.endswith('"')
+    assert etag == make_etag("id1", b"body")
+    assert etag != make_etag("id1", b"other body")
+
+
+def test_lru_eviction_keeps_recently_used_entries():
+    cache = ResponseCache(max_entries=2)
+    cache.put("a", '"a"', b"A")
+    cache.put("b", '"b"', b"B")
+    assert cache.get("a") == ('"a"', b"A")  # "a" becomes most recently used
+    cache.put("c", '"c"', b"C")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == ('"a"', b"A")
+    assert cache.get("c") == ('"c"', b"C")
+    assert len(cache) == 2
+
+
+def test_put_overwrites_without_growing():
+    cache = ResponseCache(max_entries=2)
+    cache.put("a", '"1"', b"1")
+    cache.put("a", '"2"', b"2")
+    assert cache.get("a") == ('"2"', b"2")
+    assert len(cache) == 1
+
+
+@pytest.mark.parametrize("max_entries", [0, -1])
+def test_non_positive_size_disables_caching(max_entries):
+    cache = ResponseCache(max_entries=max_entries)
+    cache.put("a", '"a"', b"A")
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_invalidate_and_clear():
+    cache = ResponseCache(max_entries=4)
+    cache.put("a", '"a"', b"A")
+    cache.put("b", '"b"', b"B")
+    cache.invalidate("a")
+    cache.invalidate("missing")
+    assert cache.get("a") is None and len(cache) == 1
+    cache.clear()
+    assert len(cache) == 0
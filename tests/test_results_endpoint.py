@@ -0,0 +1,63 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from response_cache import result_cache
+
+STORED = {"_id": "665f1c2e9b1e8a0012345678", "session_id": "s1", "query": "q", "output": "analysis", "filename": "f.pdf"}
+
+
+@pytest.fixture
+def mongo_reads(monkeypatch):
+    reads = []
+
+    def get_result(session_id):
+        reads.append(session_id)
+        return dict(STORED) if session_id == "s1" else None
+
+    monkeypatch.setattr(main.mongo_storage, "get_result", get_result)
+    result_cache.clear()
+    yield reads
+    result_cache.clear()
+
+
+@pytest.fixture
+def client():
+    return TestClient(main.app)
+
+
+def test_first_request_returns_body_with_validators(client, mongo_reads):
+    response = client.get("/results/s1")
+    assert response.status_code == 200
+    assert response.json() == {"status": "success", "result": STORED}
+    assert response.headers["ETag"].startswith(f'"{STORED["_id"]}-')
+    assert response.headers["Cache-Control"] == f"private, max-age={main.settings.RESULT_CACHE_MAX_AGE}, immutable"
+
+
+def test_matching_if_none_match_gets_empty_304_with_headers(client, mongo_reads):
+    etag = client.get("/results/s1").headers["ETag"]
+    response = client.get("/results/s1", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+    assert "immutable" in response.headers["Cache-Control"]
+
+
+def test_stale_if_none_match_gets_full_response(client, mongo_reads):
+    response = client.get("/results/s1", headers={"If-None-Match": '"stale"'})
+    assert response.status_code == 200
+    assert response.json()["result"] == STORED
+
+
+def test_cache_hit_skips_mongo(client, mongo_reads):
+    first = client.get("/results/s1")
+    second = client.get("/results/s1")
+    assert mongo_reads == ["s1"]
+    assert second.content == first.content
+    assert second.headers["ETag"] == first.headers["ETag"]
+
+
+def test_missing_result_is_404_and_not_cached(client, mongo_reads):
+    assert client.get("/results/missing").status_code == 404
+    assert client.get("/results/missing").status_code == 404
+    assert mongo_reads == ["missing", "missing"]
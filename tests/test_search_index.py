@@ -0,0 +1,55 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from search_index import SearchIndex
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = SearchIndex(str(tmp_path / "search.db"))
+    index.add_document("whole-second", "a.pdf", "q", "revenue", created_at=datetime(2026, 1, 1, 8, 0, 0))
+    index.add_document("half-second", "b.pdf", "q", "revenue", created_at=datetime(2026, 1, 1, 8, 0, 0, 500000))
+    return index
+
+
+def sessions(result):
+    return sorted(hit["session_id"] for hit in result["results"])
+
+
+def test_date_to_is_inclusive_and_excludes_later_fractions(index):
+    assert sessions(index.search("revenue", date_to=datetime(2026, 1, 1, 8, 0, 0))) == ["whole-second"]
+    assert sessions(index.search("revenue", date_to=datetime(2026, 1, 1, 8, 0, 0, 500000))) == ["half-second", "whole-second"]
+
+
+def test_date_from_is_inclusive_and_excludes_earlier_times(index):
+    assert sessions(index.search("revenue", date_from=datetime(2026, 1, 1, 8, 0, 0, 100000))) == ["half-second"]
+    assert sessions(index.search("revenue", date_from=datetime(2026, 1, 1, 8, 0, 0))) == ["half-second", "whole-second"]
+
+
+def test_aware_bounds_are_converted_to_utc(index):
+    bound = datetime(2026, 1, 1, 8, 0, 0, tzinfo=timezone.utc)
+    assert sessions(index.search("revenue", date_from=bound, date_to=bound)) == ["whole-second"]
+
+
+def test_ranking_and_pagination(tmp_path):
+    index = SearchIndex(str(tmp_path / "search.db"))
+    index.add_document("strong", "a.pdf", "q", "covenant breach covenant breach")
+    index.add_document("weak", "b.pdf", "q", "covenant liquidity outlook stable")
+    index.add_document("none", "c.pdf", "q", "dividend")
+
+    first = index.search("covenant breach", page_size=1)
+    assert first["total"] == 2
+    assert sessions(first) == ["strong"]
+    assert sessions(index.search("covenant breach", page=2, page_size=1)) == ["weak"]
+
+
+def test_filename_filter_is_a_literal_substring(tmp_path):
+    index = SearchIndex(str(tmp_path / "search.db"))
+    index.add_document("underscore", "Q1_2024.pdf", "q", "revenue")
+    index.add_document("other", "q1x2024.pdf", "q", "revenue")
+    index.add_document("percent", "growth_100%.pdf", "q", "revenue")
+
+    assert sessions(index.search("revenue", filename="q1_2024")) == ["underscore"]
+    assert sessions(index.search("revenue", filename="100%")) == ["percent"]
+    assert sessions(index.search("revenue", filename="%")) == ["percent"]
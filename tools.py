@@ -1,21 +1,35 @@
 ## Importing libraries and files
 import os
 import asyncio
+import threading
 from typing import Optional, List, Any
 from conf import settings
+from telemetry import stage
+from memory_tracking import current_rss_mb, trim_memory
 from crewai.tools import BaseTool
-from crewai_tools import SerperDevTool
+from providers import build_search_tool
 from pydantic import BaseModel, Field
 import fitz  # PyMuPDF for PDF processing with image and table support
 
 from PIL import Image
+import pytesseract
 import io
 import pandas as pd
 import numpy as np
 import re
 
 ## Creating search tool
-search_tool = SerperDevTool(api_key=settings.SERPER_API_KEY)
+search_tool = build_search_tool()
+
+# Decoded pixmaps are the largest transient allocations during extraction; cap how
+# many can be alive at once across threads sharing this process.
+_pixmap_slots = threading.BoundedSemaphore(settings.PDF_MAX_CONCURRENT_PIXMAPS)
+
+
+def _release_pdf_memory() -> None:
+    """Drop MuPDF's object/image cache and return freed heap to the OS."""
+    fitz.TOOLS.store_shrink(100)
+    trim_memory()
 
 ## Input models for tools
 class PDFInput(BaseModel):
@@ -30,6 +44,69 @@ class FinancialDocumentTool(BaseTool):
     description: str = "Read and extract content from PDF files including text, tables, and images"
     args_schema: type[BaseModel] = PDFInput
 
+    def _extract_page(self, doc, page_num: int) -> str:
+        """Extract text, tables and OCR'd image text from a single page."""
+        page = doc[page_num]
+        page_content = f"\n=== Page {page_num + 1} ===\n"
+        
+        # Extract text
+        text = page.get_text()
+        if text.strip():
+            page_content += f"\n--- Text Content ---\n{text}\n"
+        
+        # Extract tables
+        tables = page.find_tables()
+        if tables:
+            page_content += f"\n--- Tables Found ({len(tables.tables)}) ---\n"
+            for i, table in enumerate(tables):
+                try:
+                    df = table.to_pandas()
+                    page_content += f"\nTable {i+1}:\n{df.to_string()}\n"
+                    del df
+                except Exception as e:
+                    page_content += f"\nTable {i+1} (raw data): {table.extract()}\n"
+        
+        # Extract and process images
+        image_list = page.get_images(full=True)
+        if image_list:
+            page_content += f"\n--- Images Found ({len(image_list)}) ---\n"
+            for img_index, img in enumerate(image_list):
+                # Skip images whose decoded pixmap would blow the memory budget
+                megapixels = img[2] * img[3] / 1_000_000
+                if megapixels > settings.PDF_MAX_IMAGE_MEGAPIXELS:
+                    page_content += f"\nImage {img_index+1}: [Image too large to process ({megapixels:.1f} MP)]\n"
+                    continue
+
+                pix = img_pil = None
+                try:
+                    with _pixmap_slots:
+                        # Get image data
+                        xref = img[0]
+                        pix = fitz.Pixmap(doc, xref)
+                        
+                        if pix.n - pix.alpha < 4:  # Check if image is in color or grayscale
+                            img_pil = Image.open(io.BytesIO(pix.tobytes("ppm")))
+                            pix = None  # The PIL copy is all OCR needs
+                            
+                            # Use OCR to extract text from image
+                            with stage("pdf.ocr", page=page_num + 1, image=img_index + 1):
+                                ocr_text = pytesseract.image_to_string(img_pil)
+                            if ocr_text.strip():
+                                page_content += f"\nImage {img_index+1} (OCR Text):\n{ocr_text}\n"
+                            else:
+                                page_content += f"\nImage {img_index+1}: [Image contains no readable text]\n"
+                        else:
+                            page_content += f"\nImage {img_index+1}: [Complex image format - cannot process]\n"
+                except Exception as e:
+                    page_content += f"\nImage {img_index+1}: [Error processing image: {str(e)}]\n"
+                finally:
+                    # Free memory
+                    pix = None
+                    if img_pil is not None:
+                        img_pil.close()
+
+        return page_content
+
     def _run(self, path: str) -> str:
         """Read data from a PDF file including text, tables, and images
 
@@ -44,59 +121,23 @@ class FinancialDocumentTool(BaseTool):
                 return f"Error: File not found at path: {path}"
             
             # Open the PDF file
-            doc = fitz.open(path)
             full_content = []
-            
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                page_content = f"\n=== Page {page_num + 1} ===\n"
-                
-                # Extract text
-                text = page.get_text()
-                if text.strip():
-                    page_content += f"\n--- Text Content ---\n{text}\n"
-                
-                # Extract tables
-                tables = page.find_tables()
-                if tables:
-                    page_content += f"\n--- Tables Found ({len(tables.tables)}) ---\n"
-                    for i, table in enumerate(tables):
-                        try:
-                            df = table.to_pandas()
-                            page_content += f"\nTable {i+1}:\n{df.to_string()}\n"
-                        except Exception as e:
-                            page_content += f"\nTable {i+1} (raw data): {table.extract()}\n"
-                
-                # Extract and process images
-                image_list = page.get_images(full=True)
-                if image_list:
-                    page_content += f"\n--- Images Found ({len(image_list)}) ---\n"
-                    for img_index, img in enumerate(image_list):
-                        try:
-                            # Get image data
-                            xref = img[0]
-                            pix = fitz.Pixmap(doc, xref)
-                            
-                            if pix.n - pix.alpha < 4:  # Check if image is in color or grayscale
-                                img_data = pix.tobytes("ppm")
-                                img_pil = Image.open(io.BytesIO(img_data))
-                                
-                                # Use OCR to extract text from image
-                                ocr_text = pytesseract.image_to_string(img_pil)
-                                if ocr_text.strip():
-                                    page_content += f"\nImage {img_index+1} (OCR Text):\n{ocr_text}\n"
-                                else:
-                                    page_content += f"\nImage {img_index+1}: [Image contains no readable text]\n"
-                            else:
-                                page_content += f"\nImage {img_index+1}: [Complex image format - cannot process]\n"
-                            
-                            pix = None  # Free memory
-                        except Exception as e:
-                            page_content += f"\nImage {img_index+1}: [Error processing image: {str(e)}]\n"
-                
-                full_content.append(page_content)
-            
-            doc.close()
+            last_trim_rss = current_rss_mb()
+            with fitz.open(path) as doc:
+                for page_num in range(len(doc)):
+                    with stage("pdf.page", page=page_num + 1):
+                        full_content.append(self._extract_page(doc, page_num))
+                    # Pages are released as soon as they are extracted; shrink
+                    # MuPDF's cache early if the process is over its budget.
+                    # A full trim (gc + malloc_trim) costs hundreds of ms, so it
+                    # only runs once RSS has grown a step since the last one.
+                    rss = current_rss_mb()
+                    if rss > settings.PDF_EXTRACTION_MEMORY_BUDGET_MB:
+                        fitz.TOOLS.store_shrink(100)
+                        if rss - last_trim_rss > settings.PDF_TRIM_GROWTH_MB:
+                            trim_memory()
+                            last_trim_rss = current_rss_mb()
+            _release_pdf_memory()
             
             # Clean and format the final content
             final_content = "\n".join(full_content)
@@ -111,6 +152,15 @@ class FinancialDocumentTool(BaseTool):
             return f"Error reading PDF file: {str(e)}"
 
 
+def extract_pdf_text(path: str) -> str:
+    """Plain-text extraction (no tables/OCR) used to feed the search index."""
+    try:
+        with fitz.open(path) as doc:
+            return "\n".join(page.get_text() for page in doc)
+    except Exception:
+        return ""
+
+
 ## Creating Investment Analysis Tool
 class InvestmentTool(BaseTool):
     name: str = "investment_analyzer"